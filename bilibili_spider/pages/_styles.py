@@ -0,0 +1,8 @@
+# bilibili_spider/pages/_styles.py
+
+from pathlib import Path
+
+STYLES_DIR = Path(__file__).resolve().parent.parent / "resources" / "styles"
+
+# 设置页面共享样式表，导入时从文件读取一次，由页面统一安装，各控件通过objectName/动态属性匹配规则
+SETTINGS_QSS = (STYLES_DIR / "settings.qss").read_text(encoding="utf-8")
@@ -1,10 +1,41 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QPushButton, QLineEdit, QTextEdit, QFrame,
-                             QMessageBox, QSpinBox)
-from PyQt6.QtCore import Qt
-from datetime import datetime
+                             QPushButton, QTextEdit, QFrame,
+                             QMessageBox, QSpinBox, QFormLayout, QTabWidget)
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
 
-from bilibili_spider.utils.cookie_helper import CookieHelper
+from bilibili_spider.pages._styles import SETTINGS_QSS
+
+# 预先解析常用的PyQt6枚举值，避免每次调用都经过枚举属性查找
+_YES = QMessageBox.StandardButton.Yes
+_YES_NO = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_DIRECT = Qt.ConnectionType.DirectConnection
+
+
+class CookieLoadWorker(QThread):
+    """
+    @description: Cookie加载线程，在后台查询数据库中的有效Cookie
+    """
+    loaded = pyqtSignal(object, bool)  # (cookie字符串或None, 是否需要更新)
+    error = pyqtSignal(str)
+
+    def __init__(self, db_handler):
+        """
+        @description: 初始化Cookie加载线程
+        @param {DatabaseHandler} db_handler - 数据库处理器实例
+        """
+        super().__init__()
+        self.db_handler = db_handler
+
+    def run(self):
+        """
+        @description: 查询有效Cookie并通过信号返回结果
+        """
+        try:
+            cookie, need_update = self.db_handler.get_valid_cookie()
+            self.loaded.emit(cookie, bool(need_update))
+        except Exception as e:
+            self.error.emit(str(e))
 
 
 class StyledFrame(QFrame):
@@ -12,6 +43,23 @@ class StyledFrame(QFrame):
     @description: 自定义样式面板控件
     """
 
+    # 所有实例共享同一样式字符串，导入时只构建一次
+    _QSS = """
+        StyledFrame {
+            background-color: #2d2d2d;
+            border-radius: 8px;
+            padding: 15px;
+            margin: 5px;
+        }
+    """
+    _TITLE_QSS = """
+        font-size: 16px;
+        font-weight: bold;
+        color: white;
+        padding: 5px;
+        margin-bottom: 10px;
+    """
+
     def __init__(self, title="", parent=None):
         """
         @description: 初始化样式面板
@@ -19,26 +67,13 @@ class StyledFrame(QFrame):
         @param {QWidget} parent - 父控件
         """
         super().__init__(parent)
-        self.setStyleSheet("""
-            StyledFrame {
-                background-color: #2d2d2d;
-                border-radius: 8px;
-                padding: 15px;
-                margin: 5px;
-            }
-        """)
+        self.setStyleSheet(self._QSS)
         self.layout = QVBoxLayout(self)
         self.layout.setSpacing(10)
 
         if title:
             label = QLabel(title)
-            label.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                color: white;
-                padding: 5px;
-                margin-bottom: 10px;
-            """)
+            label.setStyleSheet(self._TITLE_QSS)
             self.layout.addWidget(label)
 
 
@@ -47,6 +82,21 @@ class SettingsPage(QWidget):
     @description: 设置页面，提供Cookie管理、爬虫配置和数据库管理功能
     """
 
+    _COOKIE_PLACEHOLDER = (
+        "请输入B站Cookie...\n"
+        "提示：Cookie中必须包含以下字段：\n"
+        "- SESSDATA\n"
+        "- bili_jct\n"
+        "- DedeUserID"
+    )
+
+    # Cookie状态 -> (提示文本, 标签样式状态)
+    _COOKIE_STATUS = {
+        "ok": ("当前状态: Cookie有效", "ok"),
+        "warn": ("当前状态: Cookie即将过期", "warn"),
+        "none": ("当前状态: 未设置Cookie", "err"),
+    }
+
     def __init__(self, config, db_handler):
         """
         @description: 初始化设置页面
@@ -57,6 +107,17 @@ class SettingsPage(QWidget):
         self.config = config
         self.db_handler = db_handler
         self.cookie_helper = None
+        self.cookie_loader = None
+        self.message_box = None
+        # 最近一次写入配置的(最小延迟, 最大延迟, 最大重试次数)
+        self.last_saved_settings = (config.DELAY_MIN, config.DELAY_MAX, config.MAX_RETRIES)
+
+        # 设置保存防抖定时器，连续修改在150ms内合并为一次保存
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(150)
+        self.save_timer.timeout.connect(self.apply_settings)
+
         self.init_ui()
         self.load_settings()
 
@@ -64,46 +125,67 @@ class SettingsPage(QWidget):
         """
         @description: 初始化用户界面
         """
+        # 构建期间暂停重绘，所有控件添加完毕后统一刷新一次
+        self.setUpdatesEnabled(False)
+
+        # 页面级样式表只安装一次，子控件通过objectName/动态属性匹配
+        self.setStyleSheet(SETTINGS_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
-        layout.setSpacing(15)
 
-        # Cookie设置区域
+        # 各设置区域放在独立标签页中，首次切换到该页时才构建内容
+        self.section_tabs = QTabWidget()
+        self.section_builders = [
+            self.build_cookie_section,
+            self.build_crawler_section,
+            self.build_database_section
+        ]
+        self.built_sections = set()
+
+        for title in ["Cookie 管理", "爬虫设置", "数据库管理"]:
+            tab = QWidget()
+            tab_layout = QVBoxLayout(tab)
+            tab_layout.setContentsMargins(0, 15, 0, 0)
+            tab_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+            self.section_tabs.addTab(tab, title)
+
+        self.section_tabs.currentChanged.connect(self.build_section, _DIRECT)
+        self.build_section(0)
+        layout.addWidget(self.section_tabs)
+
+        self.setUpdatesEnabled(True)
+
+    def build_section(self, index):
+        """
+        @description: 构建指定标签页的内容，每个标签页只构建一次
+        @param {int} index - 标签页索引
+        """
+        if index < 0 or index in self.built_sections:
+            return
+        self.built_sections.add(index)
+        frame = self.section_builders[index]()
+        self.section_tabs.widget(index).layout().addWidget(frame)
+
+    def build_cookie_section(self):
+        """
+        @description: 构建Cookie管理区域
+        @return {StyledFrame} - Cookie管理面板
+        """
         cookie_frame = StyledFrame("Cookie 管理")
         cookie_frame.layout.setContentsMargins(10, 5, 10, 5)
 
         # Cookie状态显示
-        status_layout = QHBoxLayout()
-        status_layout.setContentsMargins(0, 5, 0, 5)
         self.cookie_status_label = QLabel("当前状态: 未设置")
-        self.cookie_status_label.setStyleSheet("""
-            color: #ff9900;
-            font-weight: bold;
-            font-size: 14px;
-            padding: 5px;
-        """)
-        status_layout.addWidget(self.cookie_status_label)
-        cookie_frame.layout.addLayout(status_layout)
+        self.cookie_status_label.setProperty("statusLabel", True)
+        self.cookie_status_label.setProperty("state", "warn")
+        self.cookie_status_label.setContentsMargins(0, 5, 0, 5)
+        cookie_frame.layout.addWidget(self.cookie_status_label)
 
         # Cookie输入区域
         self.cookie_input = QTextEdit()
-        self.cookie_input.setPlaceholderText(
-            "请输入B站Cookie...\n"
-            "提示：Cookie中必须包含以下字段：\n"
-            "- SESSDATA\n"
-            "- bili_jct\n"
-            "- DedeUserID"
-        )
-        self.cookie_input.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 10px;
-                font-size: 14px;
-            }
-        """)
+        self.cookie_input.setPlaceholderText(self._COOKIE_PLACEHOLDER)
+        self.cookie_input.setObjectName("cookieInput")
         self.cookie_input.setMaximumHeight(150)
         cookie_frame.layout.addWidget(self.cookie_input)
 
@@ -111,26 +193,6 @@ class SettingsPage(QWidget):
         button_layout = QHBoxLayout()
         button_layout.setSpacing(10)
 
-        button_styles = """
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 120px;
-                min-height: 40px;
-            }
-            QPushButton:hover {
-                background-color: #1184db;
-            }
-            QPushButton:pressed {
-                background-color: #006abc;
-            }
-        """
-
         # 创建并添加按钮
         for btn_text, btn_action in [
             ("快速获取Cookie", self.show_cookie_helper),
@@ -139,62 +201,32 @@ class SettingsPage(QWidget):
             ("清除Cookie", self.clear_cookie)
         ]:
             btn = QPushButton(btn_text)
-            btn.setStyleSheet(button_styles)
-            btn.clicked.connect(btn_action)
+            btn.setProperty("role", "cookie")
+            btn.clicked.connect(btn_action, _DIRECT)
             button_layout.addWidget(btn)
 
         cookie_frame.layout.addLayout(button_layout)
-        layout.addWidget(cookie_frame)
+        return cookie_frame
 
-        # 爬虫配置区域
+    def build_crawler_section(self):
+        """
+        @description: 构建爬虫设置区域
+        @return {StyledFrame} - 爬虫设置面板
+        """
         crawler_frame = StyledFrame("爬虫设置")
         crawler_frame.layout.setContentsMargins(10, 5, 10, 5)
 
+        # 标签+输入框行统一使用表单布局，字段保持建议尺寸不随窗口拉伸
+        form_layout = QFormLayout()
+        form_layout.setContentsMargins(0, 5, 0, 5)
+        form_layout.setVerticalSpacing(10)
+        form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.FieldsStayAtSizeHint)
+
         # 延迟设置
         delay_layout = QHBoxLayout()
-        delay_layout.setContentsMargins(0, 5, 0, 5)
 
         delay_label = QLabel("请求延迟范围(秒):")
-        delay_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 14px;
-                padding: 5px;
-            }
-        """)
-        delay_layout.addWidget(delay_label)
-
-        # 优化的SpinBox样式 - 修复高度问题
-        spinbox_style = """
-            QSpinBox {
-                padding: 8px;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                background-color: #2d2d2d;
-                color: white;
-                font-size: 14px;
-                min-height: 27px;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                width: 20px;
-                height: 18px;
-                background: #404040;
-                border: none;
-                subcontrol-origin: border;
-            }
-            QSpinBox::up-button {
-                subcontrol-position: top right;
-            }
-            QSpinBox::down-button {
-                subcontrol-position: bottom right;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background: #505050;
-            }
-            QSpinBox::up-button:pressed, QSpinBox::down-button:pressed {
-                background: #606060;
-            }
-        """
+        delay_label.setObjectName("fieldLabel")
 
         # 最小延迟输入框
         self.min_delay = QSpinBox()
@@ -202,19 +234,12 @@ class SettingsPage(QWidget):
         self.min_delay.setValue(self.config.DELAY_MIN)
         self.min_delay.setMinimumWidth(80)
         self.min_delay.setMinimumHeight(27)  # 增加最小高度
-        self.min_delay.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.min_delay.setStyleSheet(spinbox_style)
+        self.min_delay.setAlignment(_ALIGN_CENTER)
 
         delay_layout.addWidget(self.min_delay)
 
         delay_to_label = QLabel("到")
-        delay_to_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 14px;
-                padding: 5px;
-            }
-        """)
+        delay_to_label.setObjectName("fieldLabel")
         delay_layout.addWidget(delay_to_label)
 
         # 最大延迟输入框
@@ -223,27 +248,14 @@ class SettingsPage(QWidget):
         self.max_delay.setValue(self.config.DELAY_MAX)
         self.max_delay.setMinimumWidth(80)
         self.max_delay.setMinimumHeight(27)  # 增加最小高度
-        self.max_delay.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.max_delay.setStyleSheet(spinbox_style)
+        self.max_delay.setAlignment(_ALIGN_CENTER)
 
         delay_layout.addWidget(self.max_delay)
-        delay_layout.addStretch()
-
-        crawler_frame.layout.addLayout(delay_layout)
+        form_layout.addRow(delay_label, delay_layout)
 
         # 重试设置
-        retry_layout = QHBoxLayout()
-        retry_layout.setContentsMargins(0, 5, 0, 5)
-
         retry_label = QLabel("最大重试次数:")
-        retry_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 14px;
-                padding: 5px;
-            }
-        """)
-        retry_layout.addWidget(retry_label)
+        retry_label.setObjectName("fieldLabel")
 
         # 重试次数输入框
         self.max_retries = QSpinBox()
@@ -251,27 +263,32 @@ class SettingsPage(QWidget):
         self.max_retries.setValue(self.config.MAX_RETRIES)
         self.max_retries.setMinimumWidth(80)
         self.max_retries.setMinimumHeight(40)  # 增加最小高度
-        self.max_retries.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.max_retries.setStyleSheet(spinbox_style)
+        self.max_retries.setAlignment(_ALIGN_CENTER)
+
+        form_layout.addRow(retry_label, self.max_retries)
 
-        retry_layout.addWidget(self.max_retries)
-        retry_layout.addStretch()
+        crawler_frame.layout.addLayout(form_layout)
 
-        crawler_frame.layout.addLayout(retry_layout)
-        layout.addWidget(crawler_frame)
+        # 连接设置值变化信号（在初始值设置之后连接，初始化时不会触发保存）
+        # 以下信号都在GUI线程发出，直接连接可省去AutoConnection的线程判断
+        self.min_delay.valueChanged.connect(self.save_settings, _DIRECT)
+        self.max_delay.valueChanged.connect(self.save_settings, _DIRECT)
+        self.max_retries.valueChanged.connect(self.save_settings, _DIRECT)
 
-        # 数据库管理区域
+        return crawler_frame
+
+    def build_database_section(self):
+        """
+        @description: 构建数据库管理区域
+        @return {StyledFrame} - 数据库管理面板
+        """
         db_frame = StyledFrame("数据库管理")
         db_frame.layout.setContentsMargins(10, 5, 10, 5)
 
         # 数据库状态
         self.db_status_label = QLabel("数据库状态: 正常")
-        self.db_status_label.setStyleSheet("""
-            color: #00cc00;
-            font-weight: bold;
-            font-size: 14px;
-            padding: 5px;
-        """)
+        self.db_status_label.setProperty("statusLabel", True)
+        self.db_status_label.setProperty("state", "ok")
         db_frame.layout.addWidget(self.db_status_label)
 
         # 数据库操作按钮
@@ -280,71 +297,32 @@ class SettingsPage(QWidget):
 
         # 清空数据库按钮
         self.clear_db_button = QPushButton("清空数据库")
-        self.clear_db_button.setStyleSheet("""
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #d83b01;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 120px;
-                min-height: 27px;
-            }
-            QPushButton:hover {
-                background-color: #e9553e;
-            }
-            QPushButton:pressed {
-                background-color: #c63502;
-            }
-        """)
+        self.clear_db_button.setProperty("variant", "danger")
 
         # 备份数据库按钮
         self.backup_db_button = QPushButton("备份数据库")
-        self.backup_db_button.setStyleSheet("""
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #107c10;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 120px;
-                min-height: 40px;
-            }
-            QPushButton:hover {
-                background-color: #13981c;
-            }
-            QPushButton:pressed {
-                background-color: #0e6a0e;
-            }
-        """)
+        self.backup_db_button.setProperty("variant", "success")
 
         db_button_layout.addWidget(self.clear_db_button)
         db_button_layout.addWidget(self.backup_db_button)
         db_button_layout.addStretch()
 
         db_frame.layout.addLayout(db_button_layout)
-        layout.addWidget(db_frame)
 
         # 连接信号
-        self.clear_db_button.clicked.connect(self.clear_database)
-        self.backup_db_button.clicked.connect(self.backup_database)
-
-        # 连接设置值变化信号
-        self.min_delay.valueChanged.connect(self.save_settings)
-        self.max_delay.valueChanged.connect(self.save_settings)
-        self.max_retries.valueChanged.connect(self.save_settings)
+        self.clear_db_button.clicked.connect(self.clear_database, _DIRECT)
+        self.backup_db_button.clicked.connect(self.backup_database, _DIRECT)
 
-        layout.addStretch()
+        return db_frame
 
     def show_cookie_helper(self):
         """
         @description: 显示Cookie获取工具
         """
         try:
+            # 延迟导入，避免未使用该工具时也加载selenium
+            from bilibili_spider.utils.cookie_helper import CookieHelper
+
             self.cookie_helper = CookieHelper(self.config, self.db_handler)
             self.cookie_helper.cookie_ready.connect(self.on_cookie_received)
         except Exception as e:
@@ -361,61 +339,109 @@ class SettingsPage(QWidget):
             # 自动保存Cookie
             if self.config.set_cookie(cookie):
                 self.db_handler.save_cookie(cookie)
-                self.load_settings()
-                QMessageBox.information(self, "成功", "Cookie已获取并保存！")
+                self.set_cookie_status("ok")
+                self.show_message(QMessageBox.Icon.Information, "成功", "Cookie已获取并保存！")
         except Exception as e:
             QMessageBox.critical(self, "错误", f"处理Cookie失败: {str(e)}")
 
     def load_settings(self):
         """
-        @description: 加载当前设置
+        @description: 加载当前设置，数据库查询在后台线程中执行
         """
-        try:
-            cookie, need_update = self.db_handler.get_valid_cookie()
-            if cookie:
+        if self.cookie_loader and self.cookie_loader.isRunning():
+            return
+
+        self.cookie_loader = CookieLoadWorker(self.db_handler)
+        self.cookie_loader.loaded.connect(self.handle_cookie_loaded)
+        self.cookie_loader.error.connect(self.handle_load_error)
+        self.cookie_loader.start()
+
+    def handle_cookie_loaded(self, cookie, need_update):
+        """
+        @description: 处理后台加载到的Cookie
+        @param {str} cookie - Cookie字符串，未设置时为None
+        @param {bool} need_update - Cookie是否即将过期
+        """
+        if cookie:
+            # 加载期间用户已输入内容时不覆盖
+            if self.cookie_input.document().isEmpty():
                 self.cookie_input.setText(cookie)
-                if need_update:
-                    self.cookie_status_label.setText("当前状态: Cookie即将过期")
-                    self.cookie_status_label.setStyleSheet("""
-                        color: #ff9900;
-                        font-weight: bold;
-                        font-size: 14px;
-                        padding: 5px;
-                    """)
-                else:
-                    self.cookie_status_label.setText("当前状态: Cookie有效")
-                    self.cookie_status_label.setStyleSheet("""
-                        color: #00cc00;
-                        font-weight: bold;
-                        font-size: 14px;
-                        padding: 5px;
-                    """)
-            else:
-                self.cookie_status_label.setText("当前状态: 未设置Cookie")
-                self.cookie_status_label.setStyleSheet("""
-                    color: #ff0000;
-                    font-weight: bold;
-                    font-size: 14px;
-                    padding: 5px;
-                """)
+            self.set_cookie_status("warn" if need_update else "ok")
+        else:
+            self.set_cookie_status("none")
 
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"加载设置失败: {str(e)}")
+    def handle_load_error(self, error_message):
+        """
+        @description: 处理Cookie加载错误
+        @param {str} error_message - 错误信息
+        """
+        QMessageBox.critical(self, "错误", f"加载设置失败: {error_message}")
+
+    def set_cookie_status(self, status):
+        """
+        @description: 直接更新Cookie状态标签，无需重新查询数据库
+        @param {str} status - Cookie状态(ok/warn/none)
+        """
+        text, state = self._COOKIE_STATUS[status]
+        self.cookie_status_label.setText(text)
+        self.set_label_state(self.cookie_status_label, state)
+
+    def set_label_state(self, label, state):
+        """
+        @description: 切换标签的state动态属性并重新polish，无需重新解析样式表
+        @param {QLabel} label - 目标标签
+        @param {str} state - 状态值(ok/warn/err)
+        """
+        # 状态未变化时跳过，避免重复计算样式规则
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+    def show_message(self, icon, title, text,
+                     buttons=QMessageBox.StandardButton.Ok):
+        """
+        @description: 复用同一个消息框实例显示提示，避免每次弹窗都重新创建和polish对话框
+        @param {QMessageBox.Icon} icon - 图标类型
+        @param {str} title - 窗口标题
+        @param {str} text - 提示内容
+        @param {QMessageBox.StandardButton} buttons - 显示的按钮
+        @return {QMessageBox.StandardButton} - 用户点击的按钮
+        """
+        if self.message_box is None:
+            self.message_box = QMessageBox(self)
+        box = self.message_box
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        box.exec()
+        return box.standardButton(box.clickedButton())
+
+    def get_cookie_text(self):
+        """
+        @description: 获取输入框中的Cookie，文档为空时直接返回，避免遍历整个文档
+        @return {str} - 去除首尾空白的Cookie字符串
+        """
+        if self.cookie_input.document().isEmpty():
+            return ""
+        return self.cookie_input.toPlainText().strip()
 
     def validate_cookie(self):
         """
         @description: 验证Cookie有效性
         """
-        cookie = self.cookie_input.toPlainText().strip()
+        cookie = self.get_cookie_text()
         if not cookie:
-            QMessageBox.warning(self, "提示", "请输入Cookie")
+            self.show_message(QMessageBox.Icon.Warning, "提示", "请输入Cookie")
             return
 
         try:
             if self.config.validate_cookie(cookie):
-                QMessageBox.information(self, "成功", "Cookie格式验证通过")
+                self.show_message(QMessageBox.Icon.Information, "成功", "Cookie格式验证通过")
             else:
-                QMessageBox.warning(self, "错误", "Cookie格式不正确或缺少必要字段")
+                self.show_message(QMessageBox.Icon.Warning, "错误", "Cookie格式不正确或缺少必要字段")
         except Exception as e:
             QMessageBox.critical(self, "错误", f"验证Cookie失败: {str(e)}")
 
@@ -423,9 +449,9 @@ class SettingsPage(QWidget):
         """
         @description: 保存Cookie到数据库
         """
-        cookie = self.cookie_input.toPlainText().strip()
+        cookie = self.get_cookie_text()
         if not cookie:
-            QMessageBox.warning(self, "提示", "请输入Cookie")
+            self.show_message(QMessageBox.Icon.Warning, "提示", "请输入Cookie")
             return
 
         try:
@@ -435,10 +461,10 @@ class SettingsPage(QWidget):
             # 设置新的Cookie
             if self.config.set_cookie(cookie):
                 self.db_handler.save_cookie(cookie)
-                self.load_settings()  # 重新加载状态
-                QMessageBox.information(self, "成功", "Cookie保存成功")
+                self.set_cookie_status("ok")  # 新保存的Cookie有效期充足
+                self.show_message(QMessageBox.Icon.Information, "成功", "Cookie保存成功")
             else:
-                QMessageBox.warning(self, "错误", "Cookie格式不正确或缺少必要字段")
+                self.show_message(QMessageBox.Icon.Warning, "错误", "Cookie格式不正确或缺少必要字段")
         except Exception as e:
             QMessageBox.critical(self, "错误", f"保存Cookie失败: {str(e)}")
 
@@ -446,18 +472,18 @@ class SettingsPage(QWidget):
         """
         @description: 清除Cookie信息
         """
-        reply = QMessageBox.question(
-            self, "确认", "确定要清除Cookie吗？",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        reply = self.show_message(
+            QMessageBox.Icon.Question, "确认", "确定要清除Cookie吗？",
+            _YES_NO
         )
 
-        if reply == QMessageBox.StandardButton.Yes:
+        if reply == _YES:
             try:
                 self.cookie_input.clear()
                 self.config.clear_cookie()
                 self.db_handler.clear_cookies()
-                self.load_settings()
-                QMessageBox.information(self, "成功", "Cookie已清除")
+                self.set_cookie_status("none")
+                self.show_message(QMessageBox.Icon.Information, "成功", "Cookie已清除")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"清除Cookie失败: {str(e)}")
 
@@ -465,16 +491,16 @@ class SettingsPage(QWidget):
         """
         @description: 清空数据库
         """
-        reply = QMessageBox.question(
-            self, "确认",
+        reply = self.show_message(
+            QMessageBox.Icon.Question, "确认",
             "确定要清空数据库吗？此操作将删除所有已爬取的评论数据！",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            _YES_NO
         )
 
-        if reply == QMessageBox.StandardButton.Yes:
+        if reply == _YES:
             try:
                 self.db_handler.clear_database()
-                QMessageBox.information(self, "成功", "数据库已清空")
+                self.show_message(QMessageBox.Icon.Information, "成功", "数据库已清空")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"清空数据库失败: {str(e)}")
 
@@ -482,25 +508,39 @@ class SettingsPage(QWidget):
         """
         @description: 备份数据库（待实现）
         """
-        QMessageBox.information(self, "提示", "数据库备份功能开发中...")
+        self.show_message(QMessageBox.Icon.Information, "提示", "数据库备份功能开发中...")
 
     def closeEvent(self, event):
         """
         @description: 窗口关闭事件处理
         @param {QCloseEvent} event - 关闭事件
         """
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self.apply_settings()
+        if self.cookie_loader and self.cookie_loader.isRunning():
+            self.cookie_loader.wait()
         if self.cookie_helper:
             self.cookie_helper.cleanup()
             self.cookie_helper = None
         event.accept()
 
     def save_settings(self):
+        """
+        @description: 请求保存爬虫设置，重启防抖定时器以合并连续修改
+        """
+        self.save_timer.start()
+
+    def apply_settings(self):
         """
         @description: 保存爬虫设置到配置类
         """
         try:
-            self.config.DELAY_MIN = self.min_delay.value()
-            self.config.DELAY_MAX = self.max_delay.value()
-            self.config.MAX_RETRIES = self.max_retries.value()
+            current = (self.min_delay.value(), self.max_delay.value(), self.max_retries.value())
+            # 与上次保存的值相同则跳过写入
+            if current == self.last_saved_settings:
+                return
+            self.config.DELAY_MIN, self.config.DELAY_MAX, self.config.MAX_RETRIES = current
+            self.last_saved_settings = current
         except Exception as e:
             QMessageBox.critical(self, "错误", f"保存设置失败: {str(e)}")
\ No newline at end of file